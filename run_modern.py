@@ -1,25 +1,27 @@
+import importlib.util
 import os
 import sys
 import subprocess
 
+REQUIRED_MODULES = ("customtkinter", "scipy", "numpy", "psutil", "packaging")
+
 def install_requirements():
     print(f"Using Python: {sys.executable}")
     print("Checking dependencies...")
-    try:
-        import customtkinter
-        import scipy
-        import numpy
-        import psutil
-        import packaging
+    # find_spec only locates the packages; importing them here would load
+    # SciPy at launch even though the app defers it until the first run
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if not missing:
         print("Dependencies found.")
-    except ImportError as e:
-        print(f"Missing dependency ({e}). Installing from requirements.txt...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-            print("Dependencies installed successfully.")
-        except subprocess.CalledProcessError:
-            print("Error: Failed to install dependencies. Please install them manually.")
-            sys.exit(1)
+        return
+
+    print(f"Missing dependency ({', '.join(missing)}). Installing from requirements.txt...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        print("Dependencies installed successfully.")
+    except subprocess.CalledProcessError:
+        print("Error: Failed to install dependencies. Please install them manually.")
+        sys.exit(1)
 
 if __name__ == "__main__":
     # Fix for multiprocessing on Windows
@@ -1,6 +1,8 @@
 """Robust integer to words converter supporting large magnitudes."""
 
-ONES = [
+from functools import lru_cache
+
+ONES = (
     "",
     "ONE",
     "TWO",
@@ -11,9 +13,9 @@ ONES = [
     "SEVEN",
     "EIGHT",
     "NINE",
-]
+)
 
-TEENS = [
+TEENS = (
     "TEN",
     "ELEVEN",
     "TWELVE",
@@ -24,9 +26,9 @@ TEENS = [
     "SEVENTEEN",
     "EIGHTEEN",
     "NINETEEN",
-]
+)
 
-TENS = [
+TENS = (
     "",
     "",
     "TWENTY",
@@ -37,14 +39,14 @@ TENS = [
     "SEVENTY",
     "EIGHTY",
     "NINETY",
-]
+)
 
-SCALES = [
+SCALES = (
     (10**12, "TRILLION"),
     (10**9, "BILLION"),
     (10**6, "MILLION"),
     (10**3, "THOUSAND"),
-]
+)
 
 
 def _convert_below_thousand(num: int) -> str:
@@ -68,6 +70,13 @@ def _convert_below_thousand(num: int) -> str:
     return words
 
 
+# Every three-digit group's spelling, built once at import so number_to_words
+# only has to index it
+_BELOW_1000 = tuple(_convert_below_thousand(i) for i in range(1000))
+
+
+# Ranges are re-spelled on every run and by the explorer; results are immutable strings
+@lru_cache(maxsize=8192)
 def number_to_words(n: int) -> str:
     """Convert any integer (|n| < 10^15) into its English words."""
     if n == 0:
@@ -79,13 +88,12 @@ def number_to_words(n: int) -> str:
     remaining = n
     for scale_value, scale_name in SCALES:
         if remaining >= scale_value:
-            chunk = remaining // scale_value
-            words.append(_convert_below_thousand(chunk))
+            chunk, remaining = divmod(remaining, scale_value)
+            words.append(_BELOW_1000[chunk])
             words.append(scale_name)
-            remaining %= scale_value
 
     if remaining:
-        words.append(_convert_below_thousand(remaining))
+        words.append(_BELOW_1000[remaining])
 
-    # Filter any empty segments and join with single spaces
-    return " ".join(filter(None, words))
+    # Only non-zero groups are appended, so every segment is non-empty
+    return " ".join(words)
@@ -20,12 +20,11 @@ import numpy as np
 from scipy.optimize import minimize
 import time
 import concurrent.futures
-import multiprocessing
 import os
 import sys
 import psutil
 import threading
-from typing import List, Dict, Callable, Optional, Any, Union
+from typing import List, Callable, Optional, Any
 
 # Ensure project root is in path for worker processes
 # This helps if the worker process doesn't inherit the path correctly on Windows
@@ -49,6 +48,19 @@ def get_safe_cpu_count() -> int:
 
 # --- Math Kernels ---
 
+# Per-thread scratch arrays reused across objective calls; the shapes only
+# change when a new number range is compiled
+_scratch = threading.local()
+
+def _scratch_buffer(name: str, shape: tuple) -> np.ndarray:
+    bufs = getattr(_scratch, 'bufs', None)
+    if bufs is None:
+        bufs = _scratch.bufs = {}
+    buf = bufs.get(name)
+    if buf is None or buf.shape != shape:
+        buf = bufs[name] = np.empty(shape, dtype=np.float64)
+    return buf
+
 def vectorized_objective(x: np.ndarray, term_coeffs: np.ndarray, term_powers: np.ndarray, 
                          term_indices: np.ndarray, targets: np.ndarray, num_numbers: int):
     """
@@ -58,9 +70,19 @@ def vectorized_objective(x: np.ndarray, term_coeffs: np.ndarray, term_powers: np
     
     # 1. Calculate term values
     try:
-        # Fast path
-        bases = np.power(x_arr, term_powers)
-        term_values = term_coeffs * np.prod(bases, axis=1)
+        # Fast path: every term is a product of letter powers, so compute all
+        # magnitudes as one matrix-vector product in log space and recover the
+        # sign from the parity of negative factors (writes into reused buffers)
+        abs_x = np.abs(x_arr)
+        is_zero = abs_x == 0.0
+        log_x = np.log(np.where(is_zero, 1.0, abs_x))
+        term_values = np.matmul(term_powers, log_x, out=_scratch_buffer('term_values', term_coeffs.shape))
+        np.exp(term_values, out=term_values)
+        neg_count = term_powers @ (x_arr < 0).astype(np.float64)
+        term_values *= 1.0 - 2.0 * np.fmod(neg_count, 2.0)
+        if is_zero.any():
+            term_values[term_powers @ is_zero.astype(np.float64) > 0] = 0.0
+        term_values *= term_coeffs
     except Exception:
         # Robust path for edge cases
         term_values = term_coeffs.copy()
@@ -69,9 +91,8 @@ def vectorized_objective(x: np.ndarray, term_coeffs: np.ndarray, term_powers: np
             if np.any(mask):
                 term_values[mask] *= np.power(x_arr[i], term_powers[mask, i])
 
-    # 2. Sum terms
-    calc_values = np.zeros(num_numbers, dtype=np.float64)
-    np.add.at(calc_values, term_indices, term_values)
+    # 2. Sum terms (segment sum per number; bincount is far cheaper than add.at)
+    calc_values = np.bincount(term_indices, weights=term_values, minlength=num_numbers)
     
     # 3. Residuals
     diffs = calc_values - targets
@@ -111,6 +132,7 @@ def solve_sign_flipping(x_start, task_args, max_flips=500):
         if err < best_err:
             best_err = err
             best_x = current_x.copy()
+            if best_err < 1e-5: break
         else:
             current_x[i] *= -1 # Flip back
 
@@ -132,9 +154,10 @@ def solve_sign_flipping(x_start, task_args, max_flips=500):
             
     return best_x, best_err
 
-def worker_task(seed: int, bounds: List, shared_data: Any, task_args: tuple):
+def worker_task(seed: int, bounds: List, shared_data: Any, task_args: tuple, temperature: float = 0.2):
     """
     Worker task that prioritizes "Snap & Flip" over random searching.
+    `temperature` is the std-dev of the jitter applied around a shared best.
     """
     np.random.seed(seed)
     
@@ -158,7 +181,7 @@ def worker_task(seed: int, bounds: List, shared_data: Any, task_args: tuple):
             
         # 2. Gradient Descent with Jitter
         # If signs didn't fix it, maybe magnitude is slightly off
-        jitter = np.random.normal(0, 0.2, 26)
+        jitter = np.random.normal(0, temperature, 26)
         initial_guess = best_x + jitter
     else:
         initial_guess = np.random.uniform(bounds[0][0], bounds[0][1], 26)
@@ -224,6 +247,9 @@ class Optimizer:
         self.should_stop = False
         self.max_allowed_workers = 1
         self.current_workers = 0
+        # Bumped per solve() so a governor from an earlier run on this
+        # (reused) optimizer stops instead of running alongside the new one
+        self._run_id = 0
 
     def _compile_terms(self):
         """Converts words to mathematical arrays."""
@@ -231,11 +257,14 @@ class Optimizer:
         powers = []
         indices = []
         targets = []
+        # Kept so callers (e.g. the results view) don't re-spell the range
+        self.spellings = []
         
         print(f"Compiling math for numbers {self.numbers[0]} to {self.numbers[-1]}...")
         
         for i, num in enumerate(self.numbers):
             spelling = number_to_words(num)
+            self.spellings.append(spelling)
             terms = self.parser.compile_to_terms(spelling)
             targets.append(num)
             
@@ -248,10 +277,13 @@ class Optimizer:
                 indices.append(i)
                 
         self.term_coeffs = np.array(coeffs, dtype=np.float64)
-        self.term_powers = np.array(powers, dtype=np.int32)
+        # Stored as float so the objective's matrix products need no casting
+        self.term_powers = np.array(powers, dtype=np.float64)
         self.term_indices = np.array(indices, dtype=np.int32)
         self.targets = np.array(targets, dtype=np.float64)
         self.num_numbers = len(self.numbers)
+        # Letters that appear in at least one spelling of the range
+        self.letters_used = [bool(n) for n in np.count_nonzero(self.term_powers.reshape(-1, 26), axis=0)]
 
     def _solve_analytical(self):
         """
@@ -325,16 +357,31 @@ class Optimizer:
             print(f"Analytical solver failed: {e}")
             return None
 
-    def _cpu_governor(self):
+    def _resolve_worker_count(self, total_cores: int) -> int:
+        """Initial number of concurrent swarm tasks for the CPU setting."""
+        setting = str(self.cpu_usage_setting)
+        if setting == 'max':
+            return total_cores
+        if setting.isdigit():
+            return max(1, min(int(setting), total_cores))
+        # 'auto': leave a core for the UI; the governor adjusts from here
+        return max(1, total_cores - 1)
+
+    def _cpu_governor(self, run_id: int):
         p = psutil.Process(os.getpid())
-        while self.running and not self.should_stop:
+        while self._run_id == run_id and self.running and not self.should_stop:
             try:
                 sys_load = psutil.cpu_percent(interval=1.0)
+                # The sample blocks for a second; the run may have ended meanwhile
+                if self._run_id != run_id or not self.running:
+                    break
                 count = get_safe_cpu_count()
-                if sys_load > 90:
-                    if self.max_allowed_workers > 1: self.max_allowed_workers -= 1
-                elif sys_load < 75:
-                    if self.max_allowed_workers < count: self.max_allowed_workers += 1
+                # Only 'auto' follows system load; other settings are fixed
+                if self.cpu_usage_setting == 'auto':
+                    if sys_load > 90:
+                        if self.max_allowed_workers > 1: self.max_allowed_workers -= 1
+                    elif sys_load < 75:
+                        if self.max_allowed_workers < count: self.max_allowed_workers += 1
                 
                 if self.callback:
                     # Send worker info in a format the UI expects
@@ -348,7 +395,15 @@ class Optimizer:
                     })
             except: pass
 
-    def solve(self):
+    def solve(self, executor: Optional[concurrent.futures.Executor] = None):
+        try:
+            return self._solve(executor)
+        finally:
+            # Every exit path (incl. early analytical success) must clear this,
+            # otherwise the CPU governor thread never exits
+            self.running = False
+
+    def _solve(self, executor: Optional[concurrent.futures.Executor]):
         self.running = True
         self.should_stop = False
         start_time = time.time()
@@ -356,7 +411,8 @@ class Optimizer:
         if self.callback:
             self.callback({'log': "Initializing optimizer..."})
 
-        threading.Thread(target=self._cpu_governor, daemon=True).start()
+        self._run_id += 1
+        threading.Thread(target=self._cpu_governor, args=(self._run_id,), daemon=True).start()
         
         task_args = (self.term_coeffs, self.term_powers, self.term_indices, self.targets, self.num_numbers)
         bounds = [(-100, 100) if self.allow_negative else (0, 100) for _ in range(26)]
@@ -409,19 +465,29 @@ class Optimizer:
         # We use a simpler executor model to avoid Manager() issues on Windows for now
         
         total_cores = get_safe_cpu_count()
-        self.max_allowed_workers = max(1, total_cores - 1)
+        self.max_allowed_workers = self._resolve_worker_count(total_cores)
         
+        # A caller-owned executor is reused as-is so its worker processes
+        # (and their NumPy/SciPy imports) survive between runs
+        if executor is not None:
+            return self._run_swarm(executor, ana_x, ana_err, task_args, bounds, start_time)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=total_cores) as executor:
+            return self._run_swarm(executor, ana_x, ana_err, task_args, bounds, start_time)
+
+    def _run_swarm(self, executor, ana_x, ana_err, task_args, bounds, start_time):
         best_global_x = ana_x if ana_x is not None else np.zeros(26)
         best_global_err = ana_err
         attempts = 0
+        submitted = 0
         last_update = time.time()
-        
-        with concurrent.futures.ProcessPoolExecutor(max_workers=total_cores) as executor:
-            futures = set()
-            
+        futures = set()
+
+        try:
             while not self.should_stop:
-                # Check results
-                done, _ = concurrent.futures.wait(futures, timeout=0.02, return_when=concurrent.futures.FIRST_COMPLETED)
+                # Check results (blocks until a task finishes or the next UI tick,
+                # so this thread isn't spinning on the GIL while workers run)
+                done, _ = concurrent.futures.wait(futures, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED)
                 
                 for future in done:
                     futures.remove(future)
@@ -444,7 +510,6 @@ class Optimizer:
                                     })
                             
                             if best_global_err < 1e-5:
-                                self.running = False
                                 return self._pack_result(best_global_x, best_global_err, attempts, start_time)
                             
                     except Exception as e:
@@ -454,12 +519,20 @@ class Optimizer:
 
                 # Submit
                 target = self.max_allowed_workers
-                if len(futures) < target:
+                while len(futures) < target:
                     self.current_workers += 1
                     # Ensure seed is within 32-bit integer range (0 to 2**32 - 1)
-                    seed = (int(time.time() * 1000000) + attempts) % (2**32 - 1)
-                    # Pass None for shared_data to avoid Manager issues
-                    futures.add(executor.submit(worker_task, seed, bounds, None, task_args))
+                    seed = (int(time.time() * 1000000) + submitted) % (2**32 - 1)
+                    # Elitism: every other task refines a snapshot of the best
+                    # solution (a plain dict, not a Manager, to avoid Windows
+                    # issues); the rest keep exploring from random starts
+                    elite = None
+                    if submitted % 2 == 0 and np.isfinite(best_global_err):
+                        elite = {'best_x': best_global_x, 'best_err': best_global_err}
+                    # Annealing: jitter around the elite shrinks as attempts accumulate
+                    temperature = max(0.02, 0.3 / (1.0 + attempts / 100.0))
+                    futures.add(executor.submit(worker_task, seed, bounds, elite, task_args, temperature))
+                    submitted += 1
                 
                 if best_global_err < 1e-9: break
                 
@@ -475,8 +548,13 @@ class Optimizer:
                         'x': best_global_x
                     })
                     last_update = now
+        finally:
+            # Drop queued tasks so a reused executor starts the next run clean
+            for future in futures:
+                future.cancel()
+            self.current_workers = 0
+            self.running = False
 
-        self.running = False
         return self._pack_result(best_global_x, best_global_err, attempts, start_time)
 
     def _pack_result(self, x, error, attempts, start_time):
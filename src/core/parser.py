@@ -3,9 +3,12 @@ Spelling Parser
 Parses number words and applies multiplication/addition rules.
 """
 
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Iterable
 from .number_to_words import number_to_words
 
+# Parsed spellings kept for the results view/explorer; oldest are dropped first
+COMPONENTS_CACHE_SIZE = 4096
+
 class SpellingParser:
     """
     Parses spelled numbers and calculates their value based on letter variables.
@@ -29,15 +32,41 @@ class SpellingParser:
     }
     
     def __init__(self, letter_values: Optional[Dict[str, float]] = None, space_operator='auto', hyphen_operator='minus', decimal_places=4):
+        self._components_cache: Dict[str, List[Tuple[str, int, str]]] = {}
         self.letter_values = letter_values or {chr(65 + i): 1.0 for i in range(26)}
         self.space_operator = space_operator
         self.hyphen_operator = hyphen_operator
         self.decimal_places = decimal_places
 
+    @property
+    def letter_values(self) -> Dict[str, float]:
+        return self._letter_values
+
+    @letter_values.setter
+    def letter_values(self, values: Dict[str, float]):
+        # Word products are memoized per letter-value set, so reassigning
+        # the values invalidates them (in-place edits of the dict do not)
+        self._letter_values = values
+        self._product_cache: Dict[str, float] = {}
+
     def parse_components(self, spelling: str) -> List[Tuple[str, int, str]]:
         """
         Break a spelled number into its components with operators.
+        The result is cached per spelling and must not be mutated.
         """
+        cached = self._components_cache.get(spelling)
+        if cached is not None:
+            return cached
+
+        components = self._split_components(spelling)
+        cache = self._components_cache
+        if len(cache) >= COMPONENTS_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[spelling] = components
+        return components
+
+    def _split_components(self, spelling: str) -> List[Tuple[str, int, str]]:
+        """Uncached parse behind parse_components."""
         components = []
         current_word = ""
         
@@ -63,7 +92,7 @@ class SpellingParser:
         if current_word and current_word in self.WORD_VALUES:
             magnitude = self.WORD_VALUES[current_word]
             components.append((current_word, magnitude, None))
-        
+
         return components
 
     def compile_to_terms(self, spelling: str) -> List[Tuple[float, List[int]]]:
@@ -71,7 +100,8 @@ class SpellingParser:
         Compiles the spelling into a list of additive terms.
         Each term is (coefficient, [list of letter indices 0-25]).
         """
-        components = self.parse_components(spelling)
+        # Compiling visits each spelling once, so bypass the components cache
+        components = self._split_components(spelling)
         if not components:
             return []
 
@@ -184,9 +214,22 @@ class SpellingParser:
 
         return current_value, " ".join(explanation_parts) + f" = {current_value:.{self.decimal_places}f}"
 
+    def calculate_spelled_values(self, spellings: Iterable[str]) -> List[Tuple[float, str]]:
+        """
+        Batch form of calculate_spelled_value for a whole range of spellings.
+        Returns (value, explanation) pairs in input order.
+        """
+        calculate = self.calculate_spelled_value
+        return [calculate(spelling) for spelling in spellings]
+
     def _word_product(self, word: str) -> float:
+        product = self._product_cache.get(word)
+        if product is not None:
+            return product
+
         letters = [c for c in word.upper() if c.isalpha()]
         product = 1.0
         for letter in letters:
             product *= self.letter_values.get(letter, 1.0)
+        self._product_cache[word] = product
         return product
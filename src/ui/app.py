@@ -1,4 +1,9 @@
 import customtkinter as ctk
+import collections
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import io
+import re
 import threading
 import time
 from tkinter import messagebox
@@ -6,19 +11,37 @@ import sys
 import os
 import math
 import multiprocessing
-import numpy as np
 
 # Add src to path to import core modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.core.optimizer import Optimizer
+# src.core.optimizer is imported where it's used: it pulls in SciPy, which
+# roughly doubles start-up time and isn't needed until the first run
 from src.core.parser import SpellingParser
 from src.core.number_to_words import number_to_words
 
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("dark-blue")
 
+# Older log lines are trimmed so long runs don't slow the textbox down
+MAX_LOG_LINES = 2000
+# Compiled optimizers kept for re-running recently used settings
+OPTIMIZER_CACHE_SIZE = 4
+# Range entries accept an optionally signed whole number (same as int())
+_INT_RE = re.compile(r'^\s*[+-]?\d+(?:_\d+)*\s*$')
+# Stats keys drawn on each tab; updates for a tab that isn't showing are held
+# back (newest value wins) and drawn when it's selected
+_TAB_STATS = {
+    "Live Progress": ('error', 'attempts', 'attempts_per_sec', 'speed', 'workers', 'eta', 'eta_seconds'),
+    "Results Analysis": ('x', 'letters_used'),
+}
+
 class App(ctk.CTk):
+    # Option menu choices; the first entry is the default
+    SPACE_OPERATORS = ("auto", "multiply", "add")
+    HYPHEN_OPERATORS = ("minus", "add", "multiply")
+    CPU_OPTIONS = ("auto", "max", "1", "2", "4", "8", "16")
+
     def __init__(self):
         super().__init__()
 
@@ -31,6 +54,17 @@ class App(ctk.CTk):
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
+        # Fonts for widgets that repeat (section headers, stat boxes, letter grid,
+        # buttons) are created once and shared instead of one CTkFont per widget
+        self._fonts = {
+            "body": ctk.CTkFont(size=14),
+            "bold": ctk.CTkFont(weight="bold"),
+            "section": ctk.CTkFont(size=14, weight="bold"),
+            "stat_title": ctk.CTkFont(size=12, weight="bold"),
+            "stat_value": ctk.CTkFont(size=16, weight="bold"),
+            "letter_value": ctk.CTkFont(family="Consolas"),
+        }
+
         # --- Sidebar ---
         self.sidebar = ctk.CTkFrame(self, width=300, corner_radius=20)
         self.sidebar.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
@@ -46,13 +80,13 @@ class App(ctk.CTk):
         self.end_entry = self.create_labeled_entry("End Number:", "10", 3)
 
         self.create_input_group("Operators", 4)
-        self.space_opt = self.create_option("Space Operator:", ["auto", "multiply", "add"], 5)
-        self.hyphen_opt = self.create_option("Hyphen Operator:", ["minus", "add", "multiply"], 6)
+        self.space_opt = self.create_option("Space Operator:", self.SPACE_OPERATORS, 5)
+        self.hyphen_opt = self.create_option("Hyphen Operator:", self.HYPHEN_OPERATORS, 6)
 
         self.create_input_group("System", 7)
-        self.cpu_opt = self.create_option("CPU Workers:", ["auto", "max", "1", "2", "4", "8", "16"], 8)
+        self.cpu_opt = self.create_option("CPU Workers:", self.CPU_OPTIONS, 8)
         
-        self.neg_switch = ctk.CTkSwitch(self.sidebar, text="Allow Negative Variables", font=ctk.CTkFont(size=14))
+        self.neg_switch = ctk.CTkSwitch(self.sidebar, text="Allow Negative Variables", font=self._fonts["body"])
         self.neg_switch.grid(row=9, column=0, padx=25, pady=(20, 10), sticky="w")
         self.neg_switch.select()
 
@@ -61,12 +95,12 @@ class App(ctk.CTk):
         self.btn_frame.grid(row=11, column=0, padx=20, pady=20, sticky="ew")
         self.btn_frame.grid_columnconfigure((0, 1), weight=1)
 
-        self.start_btn = ctk.CTkButton(self.btn_frame, text="START", font=ctk.CTkFont(weight="bold"), 
+        self.start_btn = ctk.CTkButton(self.btn_frame, text="START", font=self._fonts["bold"], 
                                        height=40, corner_radius=10, fg_color="#2CC985", hover_color="#22A06B",
                                        command=self.start_optimization)
         self.start_btn.grid(row=0, column=0, padx=5, sticky="ew")
 
-        self.stop_btn = ctk.CTkButton(self.btn_frame, text="STOP", font=ctk.CTkFont(weight="bold"),
+        self.stop_btn = ctk.CTkButton(self.btn_frame, text="STOP", font=self._fonts["bold"],
                                       height=40, corner_radius=10, fg_color="#FF4757", hover_color="#CC3946",
                                       state="disabled", command=self.stop_optimization)
         self.stop_btn.grid(row=0, column=1, padx=5, sticky="ew")
@@ -76,7 +110,7 @@ class App(ctk.CTk):
         self.status_lbl.grid(row=12, column=0, pady=(0, 20))
 
         # --- Main Content ---
-        self.main_view = ctk.CTkTabview(self, corner_radius=20)
+        self.main_view = ctk.CTkTabview(self, corner_radius=20, command=self._on_tab_changed)
         self.main_view.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
         
         self.tab_progress = self.main_view.add("Live Progress")
@@ -84,15 +118,50 @@ class App(ctk.CTk):
         self.tab_explorer = self.main_view.add("Number Explorer")
 
         self.setup_progress_tab()
-        self.setup_results_tab()
-        self.setup_explorer_tab()
+        # The other tabs' widgets are only created once they are first needed
+        self._tab_builders = {
+            "Results Analysis": self.setup_results_tab,
+            "Number Explorer": self.setup_explorer_tab,
+        }
 
         self.optimizer = None
+        self._letters_used = [True] * 26
+        self._parser = None
+        self._results_by_number = {}
+        # Rendered explorer text per input, valid for the current _parser
+        self._explorer_cache = {}
+        # (displayed letter state, parser) for explorer queries during a run
+        self._live_parser = None
+        self._hidden_stats = {}
+        self._optimizer_cache = {}
         self.is_running = False
         self.start_time = 0
 
+        # Solver worker processes are spawned once and reused across runs
+        self._executor = None
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Worker -> UI updates are queued here (deque append/popleft are
+        # thread-safe) and applied in batches by a ~30 Hz poll on the Tk thread
+        self._stats_queue = collections.deque()
+        self._poll_job = None
+        # Pending log text; its buffer is reused between flushes
+        self._log_sio = io.StringIO()
+
+    def _on_tab_changed(self):
+        name = self.main_view.get()
+        self._ensure_tab(name)
+        pending = self._hidden_stats.pop(name, None)
+        if pending:
+            self._render_progress(pending)
+
+    def _ensure_tab(self, name):
+        builder = self._tab_builders.pop(name, None)
+        if builder is not None:
+            builder()
+
     def create_input_group(self, text, row):
-        lbl = ctk.CTkLabel(self.sidebar, text=text, font=ctk.CTkFont(size=14, weight="bold"), text_color=("gray50", "gray70"))
+        lbl = ctk.CTkLabel(self.sidebar, text=text, font=self._fonts["section"], text_color=("gray50", "gray70"))
         lbl.grid(row=row, column=0, padx=25, pady=(20, 5), sticky="w")
 
     def create_labeled_entry(self, text, default, row):
@@ -131,7 +200,7 @@ class App(ctk.CTk):
         
         self.big_error_lbl = ctk.CTkLabel(self.error_frame, text="0.000000", font=ctk.CTkFont(family="Roboto Mono", size=48, weight="bold"), text_color="#FF4757")
         self.big_error_lbl.pack(pady=20)
-        self.error_desc_lbl = ctk.CTkLabel(self.error_frame, text="Current Total Error", font=ctk.CTkFont(size=14))
+        self.error_desc_lbl = ctk.CTkLabel(self.error_frame, text="Current Total Error", font=self._fonts["body"])
         self.error_desc_lbl.pack(pady=(0, 20))
 
         # Stats Grid
@@ -139,11 +208,11 @@ class App(ctk.CTk):
         self.stats_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="ew")
         self.stats_frame.grid_columnconfigure((0, 1, 2, 3, 4), weight=1)
 
-        self.stat_attempts = self.create_stat_box(self.stats_frame, "Attempts", "0", 0)
-        self.stat_speed = self.create_stat_box(self.stats_frame, "Speed", "0 it/s", 1)
-        self.stat_time = self.create_stat_box(self.stats_frame, "Time Elapsed", "00:00", 2)
-        self.stat_workers = self.create_stat_box(self.stats_frame, "Active Workers", "0", 3)
-        self.stat_eta = self.create_stat_box(self.stats_frame, "ETA", "—", 4)
+        self.stat_attempts_var = self.create_stat_box(self.stats_frame, "Attempts", "0", 0)
+        self.stat_speed_var = self.create_stat_box(self.stats_frame, "Speed", "0 it/s", 1)
+        self.stat_time_var = self.create_stat_box(self.stats_frame, "Time Elapsed", "00:00", 2)
+        self.stat_workers_var = self.create_stat_box(self.stats_frame, "Active Workers", "0", 3)
+        self.stat_eta_var = self.create_stat_box(self.stats_frame, "ETA", "—", 4)
 
         # Log
         self.log_box = ctk.CTkTextbox(self.tab_progress, font=ctk.CTkFont(family="Consolas", size=12), corner_radius=10)
@@ -153,12 +222,15 @@ class App(ctk.CTk):
         frame = ctk.CTkFrame(parent, corner_radius=10)
         frame.grid(row=0, column=col, padx=5, sticky="ew")
         
-        lbl_title = ctk.CTkLabel(frame, text=title, font=ctk.CTkFont(size=12, weight="bold"), text_color="gray70")
+        lbl_title = ctk.CTkLabel(frame, text=title, font=self._fonts["stat_title"], text_color="gray70")
         lbl_title.pack(pady=(10, 0))
         
-        lbl_val = ctk.CTkLabel(frame, text=value, font=ctk.CTkFont(size=16, weight="bold"))
+        # Values change several times a second; setting a bound variable is one
+        # Tcl call instead of a full CTkLabel.configure per update
+        var = ctk.StringVar(value=value)
+        lbl_val = ctk.CTkLabel(frame, textvariable=var, font=self._fonts["stat_value"])
         lbl_val.pack(pady=(0, 10))
-        return lbl_val
+        return var
 
     def setup_results_tab(self):
         self.tab_results.grid_columnconfigure(0, weight=1)
@@ -168,18 +240,21 @@ class App(ctk.CTk):
         self.letters_frame = ctk.CTkScrollableFrame(self.tab_results, corner_radius=10, height=180)
         self.letters_frame.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
         
+        # Letter and value labels sit in paired grid columns directly on the
+        # scrollable frame; a wrapper frame per letter would double the widgets
         self.letter_widgets = {}
+        # Last (text, color) written to each letter label, A-Z
+        self._letter_shown = [None] * 26
         for i in range(26):
             l = chr(65+i)
-            f = ctk.CTkFrame(self.letters_frame, fg_color="transparent")
-            f.grid(row=i//9, column=i%9, padx=5, pady=5, sticky="ew")
-            
-            ctk.CTkLabel(f, text=l, font=ctk.CTkFont(weight="bold")).pack(side="left")
-            val = ctk.CTkLabel(f, text="0.00", font=ctk.CTkFont(family="Consolas"), text_color="#2CC985")
-            val.pack(side="right", padx=5)
+            row, col = divmod(i, 9)
+            ctk.CTkLabel(self.letters_frame, text=l, font=self._fonts["bold"]).grid(
+                row=row, column=2*col, padx=(5, 0), pady=5, sticky="w")
+            val = ctk.CTkLabel(self.letters_frame, text="0.00", font=self._fonts["letter_value"], text_color="#2CC985")
+            val.grid(row=row, column=2*col+1, padx=(0, 10), pady=5, sticky="e")
             self.letter_widgets[l] = val
             
-        self.letters_frame.grid_columnconfigure(tuple(range(9)), weight=1)
+        self.letters_frame.grid_columnconfigure(tuple(range(1, 18, 2)), weight=1)
 
         # Detailed List
         self.results_box = ctk.CTkTextbox(self.tab_results, font=ctk.CTkFont(family="Consolas", size=14), corner_radius=10)
@@ -199,17 +274,37 @@ class App(ctk.CTk):
         self.exp_out.grid(row=2, column=0, padx=40, pady=20, sticky="nsew")
         self.tab_explorer.grid_rowconfigure(2, weight=1)
 
-    def log(self, msg):
-        self.log_box.insert("end", f"[{time.strftime('%H:%M:%S')}] {msg}\n")
-        self.log_box.see("end")
+    def log(self, msg, flush=True):
+        # flush=False only buffers the line, so callers emitting several lines
+        # in a row can write them to the textbox with one insert
+        self._log_sio.write(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
+        if flush:
+            self._flush_log()
+
+    def _flush_log(self):
+        # One insert per batch keeps the textbox from re-laying out per line
+        pending = self._log_sio.getvalue()
+        if pending:
+            self._log_sio.seek(0)
+            self._log_sio.truncate()
+            if pending.count("\n") > MAX_LOG_LINES:
+                # Only the tail would survive the trim below, so don't insert the rest
+                pending = "".join(pending.splitlines(True)[-MAX_LOG_LINES:])
+            self.log_box.insert("end", pending)
+
+            lines = int(self.log_box.index("end-1c").split(".")[0])
+            if lines > MAX_LOG_LINES:
+                self.log_box.delete("1.0", f"{lines - MAX_LOG_LINES}.0")
+            self.log_box.see("end")
 
     def start_optimization(self):
-        try:
-            start = int(self.start_entry.get())
-            end = int(self.end_entry.get())
-        except ValueError:
-            messagebox.showerror("Error", "Invalid range inputs")
-            return
+        start_text = self.start_entry.get()
+        end_text = self.end_entry.get()
+        for label, text in (("Start", start_text), ("End", end_text)):
+            if not _INT_RE.match(text):
+                messagebox.showerror("Error", f"{label} must be a whole number, got '{text.strip()}'")
+                return
+        start, end = int(start_text), int(end_text)
 
         allow_neg = bool(self.neg_switch.get())
 
@@ -228,6 +323,10 @@ class App(ctk.CTk):
                 start = 0
 
         self.is_running = True
+        self._parser = None
+        self._results_by_number = {}
+        self._explorer_cache = {}
+        self._hidden_stats = {}
         self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
         self.status_lbl.configure(text="Optimizing... (Continuous Mode)", text_color="#2CC985")
@@ -236,8 +335,13 @@ class App(ctk.CTk):
         
         self.start_time = time.time()
         self.update_timer()  # Start the smooth timer
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+        self._poll_stats()
         
-        threading.Thread(target=self.run_optimizer_thread, args=(start, end), daemon=True).start()
+        # Settings are read once here on the Tk thread and handed to the worker
+        config = (start, end, self.space_opt.get(), self.hyphen_opt.get(), allow_neg)
+        threading.Thread(target=self.run_optimizer_thread, args=(config, self.cpu_opt.get()), daemon=True).start()
 
     def update_timer(self):
         if self.is_running:
@@ -250,7 +354,7 @@ class App(ctk.CTk):
             else:
                 time_str = f"{mins:02d}:{secs:02d}"
                 
-            self.stat_time.configure(text=time_str)
+            self.stat_time_var.set(time_str)
             self.after(100, self.update_timer)
 
     def stop_optimization(self):
@@ -258,59 +362,132 @@ class App(ctk.CTk):
         self.log("Stopping requested...")
         self.status_lbl.configure(text="Stopping...", text_color="orange")
 
-    def run_optimizer_thread(self, start, end):
+    def run_optimizer_thread(self, config, cpu_usage):
         try:
+            from src.core.optimizer import Optimizer
+
             def callback(data):
                 if not self.is_running:
                     raise StopIteration
                 
-                # Update UI immediately (or let Tkinter handle the queue)
-                self.after(0, lambda: self.update_progress(data))
-
-            self.optimizer = Optimizer(
-                start, end,
-                space_operator=self.space_opt.get(),
-                hyphen_operator=self.hyphen_opt.get(),
-                cpu_usage=self.cpu_opt.get(),
-                allow_negative=bool(self.neg_switch.get()),
-                callback=callback
-            )
+                # No Tk calls from this thread; the UI poll picks it up
+                self._stats_queue.append(data)
+
+            optimizer = self._optimizer_cache.pop(config, None)
+            if optimizer is not None and not optimizer.running:
+                # Same range and operators as a recent run: reuse its compiled terms
+                optimizer.callback = callback
+                optimizer.cpu_usage_setting = cpu_usage
+            else:
+                start, end, space_operator, hyphen_operator, allow_neg = config
+                optimizer = Optimizer(
+                    start, end,
+                    space_operator=space_operator,
+                    hyphen_operator=hyphen_operator,
+                    cpu_usage=cpu_usage,
+                    allow_negative=allow_neg,
+                    callback=callback
+                )
+
+            # Most recently used last; evict the oldest beyond the limit
+            self._optimizer_cache[config] = optimizer
+            while len(self._optimizer_cache) > OPTIMIZER_CACHE_SIZE:
+                del self._optimizer_cache[next(iter(self._optimizer_cache))]
+            self.optimizer = optimizer
+            # Resolved once per run rather than looked up on every update
+            self._letters_used = optimizer.letters_used
             
-            result = self.optimizer.solve()
+            result = self.optimizer.solve(executor=self._get_executor())
             
             self.after(0, lambda: self.finish_optimization(result))
             
         except Exception as e:
-            self.after(0, lambda: self.log(f"Error: {e}"))
-            self.after(0, self.reset_ui)
+            if isinstance(e, BrokenProcessPool):
+                # A worker died; start from a fresh pool next run
+                self._executor = None
+            # Format now: `e` is unbound once this except block exits
+            msg = "Stopped." if isinstance(e, StopIteration) else f"Error: {e}"
+            self.after(0, lambda: self.abort_optimization(msg))
+
+    def abort_optimization(self, msg):
+        self._drain_stats()
+        self.log(msg)
+        self.reset_ui()
+
+    def _poll_stats(self):
+        self._drain_stats()
+        # Keep polling until the run ends and everything queued has been shown
+        if self.is_running or self._stats_queue:
+            self._poll_job = self.after(33, self._poll_stats)
+        else:
+            self._poll_job = None
+
+    def _drain_stats(self):
+        """Apply all queued optimizer updates in one pass on the Tk thread."""
+        merged = {}
+        stamp = time.strftime('%H:%M:%S')
+        while self._stats_queue:
+            data = self._stats_queue.popleft()
+            if 'check_stop' in data:
+                continue
+            if 'log' in data:
+                self._log_sio.write(f"[{stamp}] {data['log']}\n")
+            merged.update(data)
+        merged.pop('log', None)
+
+        if merged:
+            self.update_progress(merged)
+        self._flush_log()
+
+    def _get_executor(self):
+        if self._executor is None:
+            from src.core.optimizer import get_safe_cpu_count
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=get_safe_cpu_count())
+        return self._executor
+
+    def on_close(self):
+        self.is_running = False
+        if self._executor is not None:
+            # Drop queued swarm tasks so workers don't keep running after exit
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
     def update_progress(self, data):
         if 'check_stop' in data:
             return
 
+        current = self.main_view.get()
+        for tab, keys in _TAB_STATS.items():
+            if tab != current and any(k in data for k in keys):
+                held = self._hidden_stats.setdefault(tab, {})
+                data = dict(data)
+                for k in keys:
+                    if k in data:
+                        held[k] = data.pop(k)
+        self._render_progress(data)
+
+    def _render_progress(self, data):
         err = data.get('error')
         if err is not None and isinstance(err, (int, float)):
-            self.big_error_lbl.configure(text=f"{err:.6f}")
-            
             # Color code error
             if err < 1e-9: color = "#2CC985" # Green
             elif err < 1: color = "#F1C40F" # Yellow
             else: color = "#FF4757" # Red
-            self.big_error_lbl.configure(text_color=color)
+            self.big_error_lbl.configure(text=f"{err:.6f}", text_color=color)
         
         # Update stats (all fields optional)
         if 'attempts' in data:
-            self.stat_attempts.configure(text=f"{data['attempts']}")
+            self.stat_attempts_var.set(f"{data['attempts']}")
         
         if 'attempts_per_sec' in data or 'speed' in data:
             aps = data.get('attempts_per_sec', data.get('speed', 0.0))
-            self.stat_speed.configure(text=f"{aps:.1f} it/s")
+            self.stat_speed_var.set(f"{aps:.1f} it/s")
         
         # Time is handled by update_timer now, but we can respect override if needed
         # if 'time' in data: ...
         
         if 'workers' in data:
-            self.stat_workers.configure(text=f"{data['workers']}")
+            self.stat_workers_var.set(f"{data['workers']}")
         
         # ETA (seconds -> mm:ss or h:mm:ss) - may be None
         if 'eta' in data or 'eta_seconds' in data:
@@ -330,7 +507,7 @@ class App(ctk.CTk):
                         eta_text = f"{em:02d}:{es:02d}"
                 except Exception:
                     eta_text = '—'
-            self.stat_eta.configure(text=eta_text)
+            self.stat_eta_var.set(eta_text)
 
         # Auto worker info (separate small update)
         if 'auto_worker_info' in data:
@@ -352,59 +529,78 @@ class App(ctk.CTk):
         
         # Update letters live (only when 'x' is present)
         if 'x' in data:
-            letters_used = data.get('letters_used', getattr(self.optimizer, 'letters_used', [True]*26))
-            for i, x in enumerate(data['x']):
-                l = chr(65+i)
-                try:
-                    used = bool(letters_used[i])
-                except Exception:
-                    used = True
-
+            self._ensure_tab("Results Analysis")
+            letters_used = data.get('letters_used', self._letters_used)
+            # letter_widgets is ordered A-Z, matching the solution vector
+            shown = self._letter_shown
+            for i, (widget, x, used) in enumerate(zip(self.letter_widgets.values(), data['x'], letters_used)):
                 if not used:
                     # Show explicit N/A for letters that never appear
-                    self.letter_widgets[l].configure(text="N/A", text_color="gray60")
+                    state = ("N/A", "gray60")
+                elif x is None or (isinstance(x, float) and (math.isinf(x) or math.isnan(x))):
+                    state = ("unknown", None)
                 else:
                     try:
-                        if x is None or (isinstance(x, float) and (math.isinf(x) or math.isnan(x))):
-                            self.letter_widgets[l].configure(text="unknown")
-                        else:
-                            self.letter_widgets[l].configure(text=f"{x:.2f}", text_color="#2CC985")
+                        state = (f"{x:.2f}", "#2CC985")
                     except Exception:
-                        self.letter_widgets[l].configure(text=str(x))
+                        state = (str(x), None)
+
+                # At two decimals most letters don't change between updates
+                if shown[i] == state:
+                    continue
+                shown[i] = state
+                text, color = state
+                if color is None:
+                    widget.configure(text=text)
+                else:
+                    widget.configure(text=text, text_color=color)
 
     def finish_optimization(self, result):
+        # Flush anything still queued so stale stats can't land after the result
+        self._drain_stats()
+
         # Detailed finish summary
         success = result.get('success', False)
         message = result.get('message', '')
         attempts = result.get('attempts', None)
         duration = result.get('duration', None)
 
-        self.log(f"Optimization Finished — Success: {success} — {message}")
+        self.log(f"Optimization Finished — Success: {success} — {message}", flush=False)
         if attempts is not None and duration is not None and duration > 0:
-            self.log(f"Attempts: {attempts} — Duration: {duration:.2f}s — Avg: {attempts/duration:.2f} it/s")
+            self.log(f"Attempts: {attempts} — Duration: {duration:.2f}s — Avg: {attempts/duration:.2f} it/s", flush=False)
 
         # Update final progress and show result (include letters_used)
         self.update_progress({
             'error': result.get('fun', 0.0),
-            'x': result.get('x', np.zeros(26)),
-            'letters_used': result.get('letters_used', getattr(self.optimizer, 'letters_used', [True]*26))
+            'x': result.get('x', [0.0] * 26),
+            'letters_used': result.get('letters_used', self._letters_used)
         })
         self.reset_ui()
+        if success:
+            self.status_lbl.configure(text="Converged", text_color="#2CC985")
 
         # Populate results area with detailed validation
+        self._ensure_tab("Results Analysis")
         self.results_box.delete("1.0", "end")
-        parser = SpellingParser(letter_values=result.get('letter_map', {}))
-
-        # If optimizer adjusted start/end due to negatives, use the optimizer if available
-        start = getattr(self.optimizer, 'start', int(self.start_entry.get()))
-        end = getattr(self.optimizer, 'end', int(self.end_entry.get()))
+        # Same operators the run was solved with, so the check matches its objective
+        parser = SpellingParser(
+            letter_values=result.get('letter_map', {}),
+            space_operator=self.optimizer.parser.space_operator,
+            hyphen_operator=self.optimizer.parser.hyphen_operator,
+        )
+        # Kept for the explorer, which evaluates against the same solution
+        self._parser = parser
+        self._explorer_cache = {}
 
         correct_count = 0
         total = 0
+        rows = []
 
-        for num in range(start, end + 1):
-            spelling = number_to_words(num)
-            val, expl = parser.calculate_spelled_value(spelling)
+        # The optimizer already spelled its (possibly negative-filtered) range
+        spellings = self.optimizer.spellings
+        values = parser.calculate_spelled_values(spellings)
+        for num, spelling, (val, expl) in zip(self.optimizer.numbers, spellings, values):
+            self._results_by_number[num] = (spelling, val, expl)
             err = (val - num) ** 2
 
             icon = "✅" if err < 0.001 else "❌"
@@ -412,13 +608,17 @@ class App(ctk.CTk):
                 correct_count += 1
             total += 1
 
-            self.results_box.insert("end", f"{icon} {num}: {spelling}\n")
-            self.results_box.insert("end", f"   {expl}\n")
-            self.results_box.insert("end", f"   Error: {err:.8f}\n\n")
+            rows.append(f"{icon} {num}: {spelling}\n   {expl}\n   Error: {err:.8f}\n\n")
+
+        # Single insert: per-row inserts re-layout the textbox every time
+        self.results_box.insert("end", "".join(rows))
 
         if total > 0:
-            self.log(f"Accuracy: {correct_count}/{total} ({correct_count/total*100:.1f}%)")
+            self.log(f"Accuracy: {correct_count}/{total} ({correct_count/total*100:.1f}%)", flush=False)
+        self._flush_log()
         self.main_view.set("Results Analysis")
+        # set() doesn't fire the tabview command; draw what was held back
+        self._on_tab_changed()
 
     def reset_ui(self):
         self.is_running = False
@@ -429,22 +629,62 @@ class App(ctk.CTk):
     def run_explorer(self):
         txt = self.exp_entry.get()
         if not txt: return
-        
-        # Get current letters
-        letters = {}
-        for l, w in self.letter_widgets.items():
-            try:
-                letters[l] = float(w.cget("text"))
-            except:
-                letters[l] = 1.0
-                
-        parser = SpellingParser(letter_values=letters)
+
+        # Answers for a finished solution never change, so each input is only
+        # worked out once; live letter values are always re-evaluated
+        text = self._explorer_cache.get(txt)
+        if text is None:
+            text = self._explain(txt)
+            if self._parser is not None:
+                self._explorer_cache[txt] = text
+
+        self.exp_out.delete("1.0", "end")
+        self.exp_out.insert("end", text)
+
+    def _explain(self, txt):
+        parser = self._parser
+        if parser is None:
+            # No finished solution yet: use the letters currently displayed,
+            # including any update held back while their tab was hidden
+            self._ensure_tab("Results Analysis")
+            pending = self._hidden_stats.pop("Results Analysis", None)
+            if pending:
+                self._render_progress(pending)
+
+            # Evaluate with the operators the letters are being fitted under: the
+            # current run's, or the selected ones if nothing has run yet
+            if self.optimizer is not None:
+                space_op = self.optimizer.parser.space_operator
+                hyphen_op = self.optimizer.parser.hyphen_operator
+            else:
+                space_op, hyphen_op = self.space_opt.get(), self.hyphen_opt.get()
+
+            # Rebuilt only when the operators or a letter label have changed since
+            # the last query, so repeat lookups keep the parser's word-product cache
+            key = (space_op, hyphen_op, tuple(self._letter_shown))
+            if self._live_parser is None or self._live_parser[0] != key:
+                letters = {}
+                for l, w in self.letter_widgets.items():
+                    try:
+                        letters[l] = float(w.cget("text"))
+                    except:
+                        letters[l] = 1.0
+                self._live_parser = (key, SpellingParser(
+                    letter_values=letters,
+                    space_operator=space_op,
+                    hyphen_operator=hyphen_op,
+                ))
+            parser = self._live_parser[1]
         
         try:
             # Try as number first
             num = int(txt)
-            spelling = number_to_words(num)
-            val, expl = parser.calculate_spelled_value(spelling)
+            cached = self._results_by_number.get(num)
+            if cached is not None:
+                spelling, val, expl = cached
+            else:
+                spelling = number_to_words(num)
+                val, expl = parser.calculate_spelled_value(spelling)
             target = num
         except ValueError:
             # Try as words
@@ -452,17 +692,15 @@ class App(ctk.CTk):
             val, expl = parser.calculate_spelled_value(spelling)
             target = None
             
-        self.exp_out.delete("1.0", "end")
-        self.exp_out.insert("end", f"Input: {txt}\n")
-        self.exp_out.insert("end", f"Spelling: {spelling}\n")
-        self.exp_out.insert("end", f"Calculated: {val:.6f}\n")
+        lines = [f"Input: {txt}\n", f"Spelling: {spelling}\n", f"Calculated: {val:.6f}\n"]
         
         if target is not None:
             err = (val - target) ** 2
-            self.exp_out.insert("end", f"Target: {target}\n")
-            self.exp_out.insert("end", f"Error: {err:.8f}\n")
+            lines.append(f"Target: {target}\n")
+            lines.append(f"Error: {err:.8f}\n")
             
-        self.exp_out.insert("end", f"\nBreakdown:\n{expl}")
+        lines.append(f"\nBreakdown:\n{expl}")
+        return "".join(lines)
 
 if __name__ == "__main__":
     # Fix for multiprocessing on Windows